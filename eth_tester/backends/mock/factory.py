@@ -1,21 +1,21 @@
 import functools
 import time
 
+from eth_hash.auto import (
+    keccak,
+)
 from eth_typing import (
     Hash32,
 )
 from eth_utils import (
-    apply_to_return_value,
     is_bytes,
     is_dict,
     is_integer,
     is_list_like,
     is_null,
     is_text,
-    keccak,
     to_bytes,
     to_dict,
-    to_tuple,
 )
 from eth_utils.toolz import (
     assoc,
@@ -44,15 +44,13 @@ BLOCK_ELASTICITY_MULTIPLIER = 2
 BASE_FEE_MAX_CHANGE_DENOMINATOR = 8
 
 
-@apply_to_return_value(b"|".join)
-@to_tuple
 def bytes_repr(value):
     if is_bytes(value):
-        yield value
+        return value
     elif is_text(value):
-        yield to_bytes(text=value)
+        return to_bytes(text=value)
     elif is_list_like(value):
-        yield b"".join(
+        return b"".join(
             (
                 b"(",
                 b",".join(bytes_repr(item) for item in value),
@@ -60,7 +58,7 @@ def bytes_repr(value):
             )
         )
     elif is_dict(value):
-        yield b"".join(
+        return b"".join(
             (
                 b"{",
                 b",".join(
@@ -73,9 +71,9 @@ def bytes_repr(value):
             )
         )
     elif is_integer(value):
-        yield to_bytes(value)
+        return to_bytes(value)
     elif is_null(value):
-        yield "None@{}".format(id(value))
+        return "None@{}".format(id(value))
     else:
         raise TypeError("Unsupported type for bytes_repr: {}".format(type(value)))
 
@@ -91,7 +89,7 @@ def add_hash(fn):
         if "hash" in value:
             return value
         else:
-            return assoc(value, "hash", keccak(bytes_repr(value)))
+            return assoc(value, "hash", fake_rlp_hash(value))
 
     return inner
 
@@ -2,20 +2,19 @@ import copy
 import itertools
 import os
 
+from eth_hash.auto import (
+    keccak,
+)
 from eth_utils import (
     decode_hex,
     denoms,
     int_to_big_endian,
     is_integer,
-    keccak,
     to_canonical_address,
     to_tuple,
 )
 from eth_utils.toolz import (
-    assoc,
-    compose,
     dissoc,
-    partial,
 )
 
 from eth_tester.backends.base import (
@@ -81,6 +80,11 @@ class MockBackend(BaseChainBackend):
     receipts = None
     fork_blocks = None
 
+    _account_state_lookup = None
+    _account_state_lookup_alloc = None
+    # position in `blocks` (i.e. the block number) of each mined block, by hash
+    _block_index_by_hash = None
+
     def __init__(self, alloc=None, genesis_block=None):
         if alloc is None:
             alloc = get_default_alloc()
@@ -97,24 +101,30 @@ class MockBackend(BaseChainBackend):
     # Snapshot API
     #
     def take_snapshot(self):
-        return copy.deepcopy(
-            {
-                "alloc": self.alloc,
-                "blocks": self.blocks,
-                "block": self.block,
-                "receipts": self.receipts,
-            }
-        )
+        # Mined blocks, receipts and the account allocation are never mutated once
+        # created, so snapshots share them and only copy the containers holding
+        # them. The pending block is modified in place and gets a full copy.
+        return {
+            "alloc": self.alloc,
+            "blocks": list(self.blocks),
+            "block": copy.deepcopy(self.block),
+            "receipts": dict(self.receipts),
+        }
 
     def revert_to_snapshot(self, snapshot):
+        # copy again so that the snapshot stays intact and can be reverted to again
         self.alloc = snapshot["alloc"]
-        self.blocks = snapshot["blocks"]
-        self.block = snapshot["block"]
-        self.receipts = snapshot["receipts"]
+        self.blocks = list(snapshot["blocks"])
+        self.block = copy.deepcopy(snapshot["block"])
+        self.receipts = dict(snapshot["receipts"])
+        self._block_index_by_hash = {
+            block["hash"]: index for index, block in enumerate(self.blocks)
+        }
 
     def reset_to_genesis(self):
         self.alloc = self.genesis_alloc
         self.blocks = []
+        self._block_index_by_hash = {}
         self.block = self.genesis_block
         self.receipts = {}
         self.fork_blocks = {}
@@ -122,7 +132,12 @@ class MockBackend(BaseChainBackend):
 
     @property
     def account_state_lookup(self):
-        return dict(self.alloc)
+        # `alloc` is only ever replaced, never mutated in place, so the lookup only
+        # needs rebuilding when a different `alloc` is in use.
+        if self._account_state_lookup_alloc is not self.alloc:
+            self._account_state_lookup = dict(self.alloc)
+            self._account_state_lookup_alloc = self.alloc
+        return self._account_state_lookup
 
     #
     # Meta
@@ -138,18 +153,20 @@ class MockBackend(BaseChainBackend):
     @to_tuple
     def mine_blocks(self, num_blocks=1, coinbase=ZERO_ADDRESS):
         for _ in range(num_blocks):
-            block_to_mine = dissoc(self.block, "hash")
-            block_hash = fake_rlp_hash(block_to_mine)
-            mined_block = assoc(block_to_mine, "hash", block_hash)
-            assign_block_info = compose(
-                partial(assoc, key="block_number", value=mined_block["number"]),
-                partial(assoc, key="block_hash", value=mined_block["hash"]),
-            )
+            # `dissoc` returns a new dict that the rest of the loop can update in place
+            mined_block = dissoc(self.block, "hash")
+            block_hash = fake_rlp_hash(mined_block)
+            mined_block["hash"] = block_hash
             mined_block["transactions"] = tuple(
-                assign_block_info(transaction)
+                {
+                    **transaction,
+                    "block_number": mined_block["number"],
+                    "block_hash": block_hash,
+                }
                 for transaction in mined_block["transactions"]
             )
             mined_block["mix_hash"] = os.urandom(32)
+            self._block_index_by_hash[block_hash] = len(self.blocks)
             self.blocks.append(mined_block)
             self.block = make_block_from_parent(mined_block)
             yield block_hash
@@ -209,12 +226,13 @@ class MockBackend(BaseChainBackend):
         else:
             transaction_serializer = serialize_transaction_as_hash
 
-        for block in itertools.chain([self.block], reversed(self.blocks)):
-            if block["hash"] == block_hash:
-                block = block
-                break
+        if self.block["hash"] == block_hash:
+            block = self.block
         else:
-            raise BlockNotFound(f"No block found for hash: {block_hash}")
+            try:
+                block = self.blocks[self._block_index_by_hash[block_hash]]
+            except KeyError:
+                raise BlockNotFound(f"No block found for hash: {block_hash}")
 
         return serialize_block(
             block,
@@ -298,20 +316,19 @@ class MockBackend(BaseChainBackend):
         return self.send_transaction(transaction)
 
     def send_transaction(self, transaction):
+        transaction_index = len(self.block["transactions"])
         full_transaction = create_transaction(
             transaction,
             self.block,
-            len(self.block["transactions"]) + 1,
+            transaction_index + 1,
             is_pending=True,
         )
-        self.receipts[full_transaction["hash"]] = make_receipt(
-            full_transaction,
-            self.block,
-            len(self.block["transactions"]),
-        )
+        transaction_hash = full_transaction["hash"]
+        receipt = make_receipt(full_transaction, self.block, transaction_index)
+        self.receipts[transaction_hash] = receipt
         self.block["transactions"].append(full_transaction)
-        self.block["gas_used"] += self.receipts[full_transaction["hash"]]["gas_used"]
-        return full_transaction["hash"]
+        self.block["gas_used"] += receipt["gas_used"]
+        return transaction_hash
 
     def send_signed_transaction(self, signed_transaction):
         transaction = dissoc(signed_transaction, "r", "s", "v")
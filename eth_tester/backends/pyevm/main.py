@@ -42,6 +42,7 @@ from eth_utils.decorators import (
 from eth_utils.toolz import (
     assoc,
 )
+import rlp
 
 from eth_tester.backends.base import (
     BaseChainBackend,
@@ -64,6 +65,7 @@ from ...validation.inbound import (
     validate_inbound_withdrawals,
 )
 from .serializers import (
+    build_mined_transaction_serializer,
     serialize_block,
     serialize_transaction,
     serialize_transaction_receipt,
@@ -94,11 +96,15 @@ if is_supported_pyevm_version_available():
     from eth.vm.spoof import (
         SpoofTransaction as EVMSpoofTransaction,
     )
+    from trie import (
+        HexaryTrie,
+    )
 else:
     EVMHeaderNotFound = None
     EVMInvalidInstruction = None
     EVMRevert = None
     GENESIS_PARENT_HASH = None
+    HexaryTrie = None
     ParisVM = None
     POST_MERGE_DIFFICULTY = None
     POST_MERGE_MIX_HASH = None
@@ -146,14 +152,20 @@ def get_default_account_state(overrides=None):
     return account_state
 
 
-@to_tuple
+# `PrivateKey` objects are immutable, so the deterministic default keys (and the
+# public keys derived on construction) can be shared across backends and resets.
+_DEFAULT_KEYS_CACHE: Dict[int, tuple] = {}
+
+
 def get_default_account_keys(quantity=None):
-    keys = KeyAPI()
     quantity = quantity or 10
-    for i in range(1, quantity + 1):
-        pk_bytes = int_to_big_endian(i).rjust(32, b"\x00")
-        private_key = keys.PrivateKey(pk_bytes)
-        yield private_key
+    if quantity not in _DEFAULT_KEYS_CACHE:
+        keys = KeyAPI()
+        _DEFAULT_KEYS_CACHE[quantity] = tuple(
+            keys.PrivateKey(int_to_big_endian(i).rjust(32, b"\x00"))
+            for i in range(1, quantity + 1)
+        )
+    return _DEFAULT_KEYS_CACHE[quantity]
 
 
 @to_tuple
@@ -173,11 +185,13 @@ def get_account_keys_from_mnemonic(mnemonic, quantity=None, hd_path=None):
         yield private_key
 
 
-@to_dict
 def generate_genesis_state_for_keys(account_keys, overrides=None):
-    for private_key in account_keys:
-        account_state = get_default_account_state(overrides=overrides)
-        yield private_key.public_key.to_canonical_address(), account_state
+    return {
+        private_key.public_key.to_canonical_address(): get_default_account_state(
+            overrides=overrides
+        )
+        for private_key in account_keys
+    }
 
 
 def get_default_genesis_params(overrides=None):
@@ -254,7 +268,7 @@ def setup_tester_chain(
             )
 
         def get_transaction_builder(self):
-            return super().get_vm().get_transaction_builder()
+            return self.get_vm_class(self.header).get_transaction_builder()
 
     if genesis_params is None:
         overrides = {}
@@ -283,37 +297,49 @@ def setup_tester_chain(
     return account_keys, chain
 
 
-def _get_block_by_number(chain, block_number):
+def _get_header_by_number(chain, block_number):
+    # the chain's header is the pending block's header
     if block_number in ("latest", "safe", "finalized"):
-        head_block = chain.get_block()
-        return chain.get_canonical_block_by_number(max(0, head_block.number - 1))
+        return chain.get_canonical_block_header_by_number(
+            max(0, chain.header.block_number - 1)
+        )
     elif block_number == "earliest":
-        return chain.get_canonical_block_by_number(0)
+        return chain.get_canonical_block_header_by_number(0)
     elif block_number == "pending":
-        return chain.get_block()
+        return chain.header
     elif is_integer(block_number):
         # Note: The head block is the pending block. If a block number is passed
         # explicitly here, return the block only if it is already part of the chain
         # (i.e. not pending).
-        head_block = chain.get_block()
-        if block_number < head_block.number:
-            return chain.get_canonical_block_by_number(block_number)
+        if block_number < chain.header.block_number:
+            return chain.get_canonical_block_header_by_number(block_number)
 
     # fallback
     raise BlockNotFound(f"No block found for block number: {block_number}")
 
 
+def _get_block_by_number(chain, block_number):
+    return chain.get_block_by_header(_get_header_by_number(chain, block_number))
+
+
 def _get_block_by_hash(chain, block_hash):
-    block = chain.get_block_by_hash(block_hash)
+    block_header = chain.get_block_header_by_hash(block_hash)
 
-    if block.number >= chain.get_block().number:
+    if block_header.block_number >= chain.header.block_number:
         raise BlockNotFound(f"No block found for block hash: {block_hash}")
 
-    block_at_height = chain.get_canonical_block_by_number(block.number)
-    if block != block_at_height:
+    if chain.get_canonical_block_hash(block_header.block_number) != block_hash:
         raise BlockNotFound(f"No block found for block hash: {block_hash}")
 
-    return block
+    return chain.get_block_by_header(block_header)
+
+
+def _get_receipt_by_index(chain, block, receipt_index):
+    # the pending block's receipt trie nodes are persisted as transactions apply,
+    # so this works for it too
+    receipt_db = HexaryTrie(db=chain.chaindb.db, root_hash=block.header.receipt_root)
+    receipt_data = receipt_db[rlp.encode(receipt_index)]
+    return block.get_receipt_builder().decode(receipt_data)
 
 
 def _get_transaction_by_hash(chain, transaction_hash):
@@ -346,14 +372,18 @@ def _execute_and_revert_transaction(chain, transaction, block_number="latest"):
 
 
 def _get_vm_for_block_number(chain, block_number):
-    block = _get_block_by_number(chain, block_number)
-    vm = chain.get_vm(at_header=block.header)
+    header = _get_header_by_number(chain, block_number)
+    vm = chain.get_vm(at_header=header)
     return vm
 
 
 class PyEVMBackend(BaseChainBackend):
     chain = None
 
+    _accounts = None
+    _key_lookup_cache = None
+    _cached_account_keys = None
+
     def __init__(
         self,
         genesis_parameters=None,
@@ -475,20 +505,32 @@ class PyEVMBackend(BaseChainBackend):
             mnemonic,
             hd_path,
         )
+        self._serialize_mined_transaction = build_mined_transaction_serializer()
 
     #
     # Private Accounts API
     #
+    def _update_account_caches(self):
+        # `account_keys` is only ever replaced, never mutated in place, so the
+        # caches only need rebuilding when a different `account_keys` is in use.
+        if self._cached_account_keys is not self.account_keys:
+            self._accounts = tuple(
+                key.public_key.to_canonical_address() for key in self.account_keys
+            )
+            self._key_lookup_cache = dict(zip(self._accounts, self.account_keys))
+            self._cached_account_keys = self.account_keys
+
     @property
     def _key_lookup(self):
-        return {key.public_key.to_canonical_address(): key for key in self.account_keys}
+        self._update_account_caches()
+        return self._key_lookup_cache
 
     #
     # Snapshot API
     #
     def take_snapshot(self):
-        block = _get_block_by_number(self.chain, "latest")
-        return block.hash
+        # the pending header is always built on top of the latest block
+        return self.chain.header.parent_hash
 
     def revert_to_snapshot(self, snapshot):
         block = self.chain.get_block_by_hash(snapshot)
@@ -514,30 +556,38 @@ class PyEVMBackend(BaseChainBackend):
     #
     # Importing blocks
     #
-    @to_tuple
     def mine_blocks(self, num_blocks=1, coinbase=ZERO_ADDRESS):
         mine_kwargs = {"coinbase": coinbase}
+        block_hashes = []
 
         for _ in range(num_blocks):
-            if isinstance(self.chain.get_vm(), ParisVM):
+            pending_vm_class = self.chain.get_vm_class(self.chain.header)
+            if issubclass(pending_vm_class, ParisVM):
                 # post-merge, generate a random `mix_hash` to simulate the
                 # `prevrandao` value.
                 mine_kwargs["mix_hash"] = os.urandom(32)
 
             block = self.chain.mine_block(**mine_kwargs)
-            yield block.hash
+            block_hashes.append(block.hash)
+
+        return tuple(block_hashes)
 
     #
     # Accounts
     #
-    @to_tuple
     def get_accounts(self):
-        for private_key in self.account_keys:
-            yield private_key.public_key.to_canonical_address()
+        self._update_account_caches()
+        return self._accounts
 
     def add_account(self, private_key):
         keys = KeyAPI()
-        self.account_keys = self.account_keys + (keys.PrivateKey(private_key),)
+        pkey = keys.PrivateKey(private_key)
+        address = pkey.public_key.to_canonical_address()
+        self._update_account_caches()
+        self.account_keys = self.account_keys + (pkey,)
+        self._accounts = self._accounts + (address,)
+        self._key_lookup_cache[address] = pkey
+        self._cached_account_keys = self.account_keys
 
     #
     # Chain data
@@ -549,8 +599,10 @@ class PyEVMBackend(BaseChainBackend):
     )
     def get_block_by_number(self, block_number, full_transaction=True):
         block = _get_block_by_number(self.chain, block_number)
-        is_pending = block.number == self.chain.get_block().number
-        return serialize_block(block, full_transaction, is_pending)
+        is_pending = block.number == self.chain.header.block_number
+        return serialize_block(
+            block, full_transaction, is_pending, self._serialize_mined_transaction
+        )
 
     @replace_exceptions(
         {
@@ -559,28 +611,46 @@ class PyEVMBackend(BaseChainBackend):
     )
     def get_block_by_hash(self, block_hash, full_transaction=True):
         block = _get_block_by_hash(self.chain, block_hash)
-        is_pending = block.number == self.chain.get_block().number
-        return serialize_block(block, full_transaction, is_pending)
+        # `_get_block_by_hash` only ever returns canonical, already mined blocks
+        return serialize_block(
+            block,
+            full_transaction,
+            is_pending=False,
+            serialize_mined_transaction=self._serialize_mined_transaction,
+        )
 
     def get_transaction_by_hash(self, transaction_hash):
         block, transaction, transaction_index = _get_transaction_by_hash(
             self.chain,
             transaction_hash,
         )
-        is_pending = block.number == self.chain.get_block().number
-        return serialize_transaction(block, transaction, transaction_index, is_pending)
+        is_pending = block.number == self.chain.header.block_number
+        return serialize_transaction(
+            block,
+            transaction,
+            transaction_index,
+            is_pending,
+            self._serialize_mined_transaction,
+        )
 
     def get_transaction_receipt(self, transaction_hash):
         block, transaction, transaction_index = _get_transaction_by_hash(
             self.chain,
             transaction_hash,
         )
-        is_pending = block.number == self.chain.get_block().number
-        block_receipts = block.get_receipts(self.chain.chaindb)
+        is_pending = block.number == self.chain.header.block_number
+        receipt = _get_receipt_by_index(self.chain, block, transaction_index)
+        if transaction_index == 0:
+            origin_gas = 0
+        else:
+            origin_gas = _get_receipt_by_index(
+                self.chain, block, transaction_index - 1
+            ).gas_used
 
         return serialize_transaction_receipt(
             block,
-            block_receipts,
+            receipt,
+            origin_gas,
             transaction,
             transaction_index,
             is_pending,
@@ -643,14 +713,14 @@ class PyEVMBackend(BaseChainBackend):
     #
     @to_dict
     def _normalize_transaction(self, transaction, block_number="latest"):
+        has_dynamic_fee_params = any(
+            _ in transaction for _ in DYNAMIC_FEE_TRANSACTION_PARAMS
+        )
         is_dynamic_fee_transaction = (
-            any(_ in transaction for _ in DYNAMIC_FEE_TRANSACTION_PARAMS)
+            has_dynamic_fee_params
             or
             # if no fee params exist, default to dynamic fee transaction:
-            not any(
-                _ in transaction
-                for _ in DYNAMIC_FEE_TRANSACTION_PARAMS + ("gas_price",)
-            )
+            "gas_price" not in transaction
         )
         is_typed_transaction = (
             is_dynamic_fee_transaction or "access_list" in transaction
@@ -676,7 +746,7 @@ class PyEVMBackend(BaseChainBackend):
             yield "to", b""
 
         if is_dynamic_fee_transaction:
-            if not any(_ in transaction for _ in DYNAMIC_FEE_TRANSACTION_PARAMS):
+            if not has_dynamic_fee_params:
                 yield "max_fee_per_gas", 1 * 10**9
                 yield "max_priority_fee_per_gas", 1 * 10**9
             elif (
@@ -708,15 +778,14 @@ class PyEVMBackend(BaseChainBackend):
     def _get_normalized_and_signed_evm_transaction(
         self, transaction, block_number="latest"
     ):
-        if transaction["from"] not in self._key_lookup:
+        signing_key = self._key_lookup.get(transaction["from"])
+        if signing_key is None:
             raise ValidationError(
                 'No valid "from" key was provided in the transaction '
                 "which is required for transaction signing."
             )
-        signing_key = self._key_lookup[transaction["from"]]
-        normalized_transaction = self._normalize_transaction(transaction, block_number)
-        evm_transaction = self._create_type_aware_unsigned_transaction(
-            normalized_transaction
+        evm_transaction = self._get_normalized_and_unsigned_evm_transaction(
+            transaction, block_number
         )
         return evm_transaction.as_signed_transaction(signing_key)
 
@@ -732,8 +801,8 @@ class PyEVMBackend(BaseChainBackend):
         return self.chain.create_unsigned_transaction(**normalized_txn)
 
     def send_raw_transaction(self, raw_transaction):
-        vm = _get_vm_for_block_number(self.chain, "latest")
-        evm_transaction = vm.get_transaction_builder().decode(raw_transaction)
+        vm_class = self.chain.get_vm_class(_get_header_by_number(self.chain, "latest"))
+        evm_transaction = vm_class.get_transaction_builder().decode(raw_transaction)
         self.chain.apply_transaction(evm_transaction)
         return evm_transaction.hash
 
@@ -774,8 +843,8 @@ class PyEVMBackend(BaseChainBackend):
         """
         validate_inbound_withdrawals(withdrawals_list)
 
-        vm = _get_vm_for_block_number(self.chain, "latest")
-        if not isinstance(vm, ShanghaiVM):
+        latest_header = _get_header_by_number(self.chain, "latest")
+        if not issubclass(self.chain.get_vm_class(latest_header), ShanghaiVM):
             raise ValidationError(
                 "Withdrawals are only supported after the Shanghai fork"
             )
@@ -794,7 +863,8 @@ class PyEVMBackend(BaseChainBackend):
         self.chain.mine_all(transactions=[], withdrawals=withdrawals)
 
     def _max_available_gas(self):
-        header = self.chain.get_block().header
+        # the pending header tracks gas used as transactions are applied
+        header = self.chain.header
         return header.gas_limit - header.gas_used
 
     @replace_exceptions(
@@ -837,9 +907,10 @@ class PyEVMBackend(BaseChainBackend):
 
     def call(self, transaction, block_number="latest"):
         # TODO: move this to the VM level.
-        defaulted_transaction = transaction.copy()
-        if "gas" not in defaulted_transaction:
-            defaulted_transaction["gas"] = self._max_available_gas()
+        if "gas" in transaction:
+            defaulted_transaction = transaction
+        else:
+            defaulted_transaction = assoc(transaction, "gas", self._max_available_gas())
 
         signed_evm_transaction = self._get_normalized_and_signed_evm_transaction(
             defaulted_transaction,
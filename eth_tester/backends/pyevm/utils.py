@@ -2,6 +2,8 @@ from __future__ import (
     absolute_import,
 )
 
+import functools
+
 import pkg_resources
 from semantic_version import (
     Version,
@@ -18,6 +20,7 @@ def get_pyevm_version():
         return None
 
 
+@functools.lru_cache(maxsize=None)
 def is_supported_pyevm_version_available():
     version = get_pyevm_version()
     return version and version >= Version("0.5.0")
@@ -17,7 +17,6 @@ from eth_typing import (
 )
 from eth_utils import (
     is_integer,
-    is_same_address,
     to_list,
     to_tuple,
 )
@@ -91,6 +90,8 @@ def handle_auto_mining(func):
                 self._pending_transactions.append(cleaned_transaction)
             finally:
                 self.revert_to_snapshot(snapshot)
+                # the snapshot only exists for this revert
+                del self._snapshots[snapshot]
         return transaction_hash
 
     def _clean_pending_transaction(pending_transaction):
@@ -202,7 +203,7 @@ class EthereumTester:
         raw_private_key = self.normalizer.normalize_inbound_private_key(private_key)
         raw_account = private_key_to_address(raw_private_key)
         account = self.normalizer.normalize_outbound_account(raw_account)
-        if any(is_same_address(account, value) for value in self.get_accounts()):
+        if raw_account in self.backend.get_accounts():
             raise ValidationError("Account already present in account list")
 
         self.backend.add_account(raw_private_key)
@@ -411,15 +412,16 @@ class EthereumTester:
 
         # feed the block hashes to any block filters
         for block_hash in block_hashes:
-            block = self.get_block_by_hash(block_hash)
-
-            for _, block_filter in self._block_filters.items():
+            if self._block_filters:
                 raw_block_hash = self.normalizer.normalize_inbound_block_hash(
                     block_hash
                 )
-                block_filter.add(raw_block_hash)
+                for block_filter in self._block_filters.values():
+                    block_filter.add(raw_block_hash)
 
-            self._process_block_logs(block)
+            if self._log_filters:
+                block = self.get_block_by_hash(block_hash)
+                self._process_block_logs(block)
 
         return block_hashes
 
@@ -462,19 +464,18 @@ class EthereumTester:
     #
     def _handle_filtering_for_transaction(self, transaction_hash):
         # feed the transaction hash to any pending transaction filters.
-        for _, filter in self._pending_transaction_filters.items():
+        if self._pending_transaction_filters:
             raw_transaction_hash = self.normalizer.normalize_inbound_transaction_hash(
                 transaction_hash,
             )
-            filter.add(raw_transaction_hash)
+            for _, filter in self._pending_transaction_filters.items():
+                filter.add(raw_transaction_hash)
 
         if self._log_filters:
             receipt = self.get_transaction_receipt(transaction_hash)
             for log_entry in receipt["logs"]:
+                raw_log_entry = self.normalizer.normalize_inbound_log_entry(log_entry)
                 for _, filter in self._log_filters.items():
-                    raw_log_entry = self.normalizer.normalize_inbound_log_entry(
-                        log_entry
-                    )
                     filter.add(raw_log_entry)
 
     @handle_auto_mining
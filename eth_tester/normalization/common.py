@@ -1,6 +1,9 @@
+import functools
+
 from eth_utils import (
-    encode_hex,
     is_hex,
+    to_canonical_address,
+    to_checksum_address,
     to_dict,
     to_tuple,
 )
@@ -12,6 +15,9 @@ from eth_tester.utils.encoding import (
     int_to_32byte_big_endian,
 )
 
+cached_to_canonical_address = functools.lru_cache(maxsize=1024)(to_canonical_address)
+cached_to_checksum_address = functools.lru_cache(maxsize=1024)(to_checksum_address)
+
 
 @curry
 @to_dict
@@ -47,4 +53,4 @@ def to_integer_if_hex(value):
 
 
 def int_to_32byte_hex(value):
-    return encode_hex(int_to_32byte_big_endian(value))
+    return "0x" + int_to_32byte_big_endian(value).hex()
@@ -1,7 +1,6 @@
 from eth_utils import (
     decode_hex,
     encode_hex,
-    to_canonical_address,
 )
 from eth_utils.toolz import (
     identity,
@@ -11,6 +10,7 @@ from .base import (
     BaseNormalizer,
 )
 from .common import (
+    cached_to_canonical_address,
     int_to_32byte_hex,
     to_integer_if_hex,
 )
@@ -35,7 +35,7 @@ class DefaultNormalizer(BaseNormalizer):
     #
     # Inbound
     #
-    normalize_inbound_account = staticmethod(to_canonical_address)
+    normalize_inbound_account = staticmethod(cached_to_canonical_address)
     normalize_inbound_block_hash = staticmethod(decode_hex)
     normalize_inbound_block_number = staticmethod(identity)
     normalize_inbound_filter_id = staticmethod(identity)
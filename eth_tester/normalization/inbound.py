@@ -13,7 +13,6 @@ from eth_utils.curried import (
     is_hex,
     is_list_like,
     is_string,
-    to_canonical_address,
     to_tuple,
 )
 from eth_utils.toolz import (
@@ -28,6 +27,7 @@ from eth_tester.validation.inbound import (
 )
 
 from .common import (
+    cached_to_canonical_address,
     normalize_array,
     normalize_dict,
     normalize_if,
@@ -59,9 +59,9 @@ def normalize_filter_params(from_block, to_block, address, topics):
     if address is None:
         yield address
     elif is_address(address):
-        yield to_canonical_address(address)
+        yield cached_to_canonical_address(address)
     elif is_list_like(address):
-        yield tuple(to_canonical_address(item) for item in address)
+        yield tuple(cached_to_canonical_address(item) for item in address)
     else:
         raise TypeError(f"Address is not in a recognized format: {address}")
 
@@ -83,7 +83,7 @@ def normalize_private_key(value):
 to_empty_or_canonical_address = apply_one_of_formatters(
     (
         (lambda addr: addr == "", lambda addr: b""),
-        (is_hex, to_canonical_address),
+        (is_hex, cached_to_canonical_address),
     )
 )
 
@@ -105,7 +105,7 @@ def _normalize_inbound_access_list(access_list):
 TRANSACTION_NORMALIZERS = {
     "type": identity,
     "chain_id": identity,
-    "from": to_canonical_address,
+    "from": cached_to_canonical_address,
     "to": to_empty_or_canonical_address,
     "gas": identity,
     "gas_price": identity,
@@ -131,7 +131,7 @@ LOG_ENTRY_NORMALIZERS = {
         normalize_if, conditional_fn=is_string, normalizer=decode_hex
     ),
     "block_number": identity,
-    "address": to_canonical_address,
+    "address": cached_to_canonical_address,
     "data": decode_hex,
     "topics": partial(normalize_array, normalizer=decode_hex),
 }
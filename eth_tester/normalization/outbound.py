@@ -9,7 +9,6 @@ from eth_utils.curried import (
     is_bytes,
     is_canonical_address,
     is_dict,
-    to_checksum_address,
 )
 from eth_utils.toolz import (
     compose,
@@ -21,22 +20,21 @@ from toolz import (
     dissoc,
 )
 
-from ..utils.encoding import (
-    int_to_32byte_big_endian,
-)
 from .common import (
+    cached_to_checksum_address,
+    int_to_32byte_hex,
     normalize_array,
     normalize_dict,
     normalize_if,
 )
 
-normalize_account = to_checksum_address
+normalize_account = cached_to_checksum_address
 normalize_account_list = partial(normalize_array, normalizer=normalize_account)
 
 to_empty_or_checksum_address = apply_one_of_formatters(
     (
         (lambda addr: addr == b"", lambda addr: ""),
-        (is_canonical_address, to_checksum_address),
+        (is_canonical_address, cached_to_checksum_address),
     )
 )
 
@@ -45,10 +43,8 @@ def _normalize_outbound_access_list(access_list):
     return tuple(
         [
             {
-                "address": to_checksum_address(entry[0]),
-                "storage_keys": tuple(
-                    [encode_hex(int_to_32byte_big_endian(k)) for k in entry[1]]
-                ),
+                "address": cached_to_checksum_address(entry[0]),
+                "storage_keys": tuple([int_to_32byte_hex(k) for k in entry[1]]),
             }
             for entry in access_list
         ]
@@ -63,7 +59,7 @@ TRANSACTION_NORMALIZERS = {
     "block_hash": partial(normalize_if, conditional_fn=is_bytes, normalizer=encode_hex),
     "block_number": identity,
     "transaction_index": identity,
-    "from": to_checksum_address,
+    "from": cached_to_checksum_address,
     "to": to_empty_or_checksum_address,
     "value": identity,
     "gas": identity,
@@ -82,7 +78,7 @@ normalize_transaction = partial(normalize_dict, normalizers=TRANSACTION_NORMALIZ
 WITHDRAWAL_NORMALIZERS = {
     "index": identity,
     "validator_index": identity,
-    "address": to_checksum_address,
+    "address": cached_to_checksum_address,
     "amount": identity,
 }
 normalize_withdrawal = partial(normalize_dict, normalizers=WITHDRAWAL_NORMALIZERS)
@@ -119,7 +115,7 @@ BLOCK_NORMALIZERS = {
     "transactions_root": encode_hex,
     "receipts_root": encode_hex,
     "state_root": encode_hex,
-    "coinbase": to_checksum_address,
+    "coinbase": cached_to_checksum_address,
     "difficulty": identity,
     "mix_hash": encode_hex,
     "total_difficulty": identity,
@@ -165,7 +161,7 @@ LOG_ENTRY_NORMALIZERS = {
         normalizer=encode_hex,
     ),
     "block_number": identity,
-    "address": to_checksum_address,
+    "address": cached_to_checksum_address,
     "data": encode_hex,
     "topics": partial(normalize_array, normalizer=encode_hex),
 }
@@ -179,7 +175,7 @@ def _normalize_contract_address(receipt):
         return assoc(
             receipt,
             "contract_address",
-            to_checksum_address(receipt["contract_address"]),
+            cached_to_checksum_address(receipt["contract_address"]),
         )
     else:
         return receipt
@@ -196,7 +192,7 @@ RECEIPT_NORMALIZERS = {
     ),
     "cumulative_gas_used": identity,
     "effective_gas_price": identity,
-    "from": to_checksum_address,
+    "from": cached_to_checksum_address,
     "gas_used": identity,
     "contract_address": identity,  # special case, see ``_normalize_contract_address()``
     "logs": partial(normalize_array, normalizer=normalize_log_entry),
@@ -1,10 +1,19 @@
-from eth_utils import (
+from eth_hash.auto import (
     keccak,
-    to_canonical_address,
 )
 import rlp
+from rlp.sedes import (
+    List,
+    big_endian_int,
+    binary,
+)
+
+# the sedes rlp infers for `[sender, nonce]`
+CONTRACT_ADDRESS_SEDES = List([binary, big_endian_int])
 
 
 def generate_contract_address(address, nonce):
-    next_account_hash = keccak(rlp.encode([address, nonce]))
-    return to_canonical_address(next_account_hash[-20:])
+    next_account_hash = keccak(
+        rlp.encode([address, nonce], sedes=CONTRACT_ADDRESS_SEDES)
+    )
+    return next_account_hash[-20:]
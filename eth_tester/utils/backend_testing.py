@@ -211,6 +211,14 @@ class BaseTestBackendDirect:
         with pytest.raises(AccountLocked):
             self._send_and_check_transaction(eth_tester, SIMPLE_TRANSACTION, account)
 
+    def test_add_account_already_present(self, eth_tester):
+        eth_tester.add_account(PK_A)
+
+        with pytest.raises(
+            ValidationError, match="Account already present in account list"
+        ):
+            eth_tester.add_account(PK_A)
+
     def test_get_balance_of_listed_accounts(self, eth_tester):
         for account in eth_tester.get_accounts():
             balance = eth_tester.get_balance(account)
@@ -605,6 +613,23 @@ class BaseTestBackendDirect:
         except Exception:
             pytest.fail("Sending replacement transaction caused exception")
 
+    def test_auto_mine_transactions_disabled_releases_snapshots(self, eth_tester):
+        eth_tester.mine_blocks()
+        eth_tester.disable_auto_mine_transactions()
+        snapshot_count = len(eth_tester._snapshots)
+
+        for value in range(1, 4):
+            eth_tester.send_transaction(
+                {
+                    "from": eth_tester.get_accounts()[0],
+                    "to": BURN_ADDRESS,
+                    "value": value,
+                    "gas": 21000,
+                    "nonce": 0,
+                }
+            )
+        assert len(eth_tester._snapshots) == snapshot_count
+
     def test_auto_mine_transactions_disabled_multiple_accounts(self, eth_tester):
         eth_tester.mine_blocks()
         eth_tester.disable_auto_mine_transactions()
@@ -6,7 +6,6 @@ from eth_utils import (
     int_to_big_endian,
 )
 from eth_utils.toolz import (
-    compose,
     curry,
 )
 
@@ -19,7 +18,9 @@ def zpad(value, length):
 zpad32 = zpad(length=32)
 
 
-int_to_32byte_big_endian = compose(
-    zpad32,
-    int_to_big_endian,
-)
+def int_to_32byte_big_endian(value):
+    try:
+        return value.to_bytes(32, "big")
+    except OverflowError:
+        # values wider than 32 bytes are returned unpadded
+        return zpad32(int_to_big_endian(value))
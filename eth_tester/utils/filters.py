@@ -1,3 +1,4 @@
+import functools
 import itertools
 from queue import (
     Empty,
@@ -7,6 +8,7 @@ from queue import (
 from eth_utils import (
     is_address,
     is_bytes,
+    is_canonical_address,
     is_integer,
     is_same_address,
     to_tuple,
@@ -142,26 +144,54 @@ def extrapolate_flat_topic_from_topic_list(value):
     return itertools.product(*_value)
 
 
+@functools.lru_cache(maxsize=256)
+def _get_flat_topic_combinations(filter_topics):
+    # a filter's topics are fixed for its lifetime, so their expansion is cached
+    if is_flat_topic_array(filter_topics):
+        return (filter_topics,)
+    elif is_valid_with_nested_topic_array(filter_topics):
+        return tuple(extrapolate_flat_topic_from_topic_list(filter_topics))
+    else:
+        raise ValueError(f"Unrecognized topics format: {filter_topics}")
+
+
 def check_if_topics_match(log_topics, filter_topics):
     if filter_topics is None:
         return True
-    elif is_flat_topic_array(filter_topics):
-        return check_if_log_matches_flat_topics(log_topics, filter_topics)
-    elif is_valid_with_nested_topic_array(filter_topics):
-        return any(
-            check_if_log_matches_flat_topics(log_topics, topic_combination)
-            for topic_combination in extrapolate_flat_topic_from_topic_list(
-                filter_topics
-            )
-        )
-    else:
+    elif not is_tuple(filter_topics):
+        raise ValueError(f"Unrecognized topics format: {filter_topics}")
+    try:
+        topic_combinations = _get_flat_topic_combinations(filter_topics)
+    except TypeError:
+        # the cache key is unhashable, so it can't be a valid topic array
         raise ValueError(f"Unrecognized topics format: {filter_topics}")
+    return any(
+        check_if_log_matches_flat_topics(log_topics, topic_combination)
+        for topic_combination in topic_combinations
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _get_canonical_address_set(addresses):
+    # `None` unless every address is canonical, so other formats keep being
+    # compared (and validated) pairwise
+    if all(is_canonical_address(item) for item in addresses):
+        return frozenset(addresses)
+    return None
 
 
 def check_if_address_match(address, addresses):
     if addresses is None:
         return True
     if is_tuple(addresses):
+        if is_canonical_address(address):
+            try:
+                address_set = _get_canonical_address_set(addresses)
+            except TypeError:
+                # unhashable members; left to the pairwise check to reject
+                address_set = None
+            if address_set is not None:
+                return address in address_set
         return any(is_same_address(address, item) for item in addresses)
     elif is_address(addresses):
         return is_same_address(addresses, address)
@@ -27,6 +27,9 @@ extras_require = {
         # Pin py-evm to exact version, until it leaves alpha.
         # EVM is very high velocity and might change API at each alpha.
         "py-evm==0.7.0a4",
+        # eth-keys signs and recovers with libsecp256k1 when coincurve is available,
+        # instead of its pure-python backend.
+        "coincurve>=6.0.0",
         "eth-hash[pysha3]>=0.1.4,<1.0.0;implementation_name=='cpython'",
         "eth-hash[pycryptodome]>=0.1.4,<1.0.0;implementation_name=='pypy'",
     ],
@@ -58,6 +61,7 @@ setup(
     install_requires=[
         "eth-abi>=3.0.1",
         "eth-account>=0.6.0",
+        "eth-hash>=0.3.1",
         "eth-keys>=0.4.0",
         "eth-utils>=2.0.0",
         "rlp>=3.0.0",
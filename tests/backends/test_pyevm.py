@@ -21,8 +21,12 @@ from eth_typing import (
 from eth_utils import (
     encode_hex,
     is_hexstr,
+    to_bytes,
     to_wei,
 )
+from eth_utils.toolz import (
+    assoc,
+)
 import pytest
 
 from eth_tester import (
@@ -43,12 +47,14 @@ from eth_tester.backends.pyevm.utils import (
 )
 from eth_tester.exceptions import (
     BlockNotFound,
+    TransactionNotFound,
     ValidationError,
 )
 from eth_tester.normalization.outbound import (
     normalize_withdrawal,
 )
 from eth_tester.utils.backend_testing import (
+    PK_A,
     SIMPLE_TRANSACTION,
     BaseTestBackendDirect,
 )
@@ -357,6 +363,79 @@ class TestPyEVMBackendDirect(BaseTestBackendDirect):
                 eth_tester, SIMPLE_TRANSACTION, ZERO_ADDRESS_HEX
             )
 
+    def test_reset_to_genesis_clears_added_account_keys(self, eth_tester):
+        account = eth_tester.add_account(PK_A)
+        assert account in eth_tester.get_accounts()
+
+        eth_tester.reset_to_genesis()
+        assert account not in eth_tester.get_accounts()
+
+        with pytest.raises(ValidationError, match=r'No valid "from" key was provided'):
+            self._send_and_check_transaction(eth_tester, SIMPLE_TRANSACTION, account)
+
+    def test_get_accounts_follows_account_keys(self, eth_tester):
+        backend = eth_tester.backend
+        backend.add_account(to_bytes(hexstr=PK_A))
+        backend.add_account(to_bytes(hexstr=PK_A))
+        assert len(backend.account_keys) == 12
+        assert backend.get_accounts() == tuple(
+            key.public_key.to_canonical_address() for key in backend.account_keys
+        )
+
+        backend.account_keys = backend.account_keys[:3]
+        assert backend.get_accounts() == tuple(
+            key.public_key.to_canonical_address() for key in backend.account_keys
+        )
+
+    def test_signing_uses_reassigned_account_keys(self, eth_tester):
+        backend = eth_tester.backend
+        account_keys = backend.account_keys
+        account = eth_tester.get_accounts()[3]
+
+        backend.account_keys = account_keys[:3]
+        with pytest.raises(ValidationError, match=r'No valid "from" key was provided'):
+            self._send_and_check_transaction(eth_tester, SIMPLE_TRANSACTION, account)
+
+        backend.account_keys = account_keys
+        self._send_and_check_transaction(eth_tester, SIMPLE_TRANSACTION, account)
+
+    def test_mined_transaction_serialization_is_not_shared(self, eth_tester):
+        accounts = eth_tester.get_accounts()
+        transaction_hash = eth_tester.send_transaction(
+            {"from": accounts[0], "to": accounts[1], "value": 1, "gas": 21000}
+        )
+
+        transaction = eth_tester.get_transaction_by_hash(transaction_hash)
+        block = eth_tester.get_block_by_number(transaction["block_number"], True)
+        assert block["transactions"][0] == transaction
+
+        block["transactions"][0]["value"] = 2
+        backend_transaction = eth_tester.backend.get_transaction_by_hash(
+            to_bytes(hexstr=transaction_hash)
+        )
+        backend_transaction["value"] = 3
+        assert eth_tester.get_transaction_by_hash(transaction_hash) == transaction
+
+    def test_reset_to_genesis_serializes_transactions_from_new_chain(self, eth_tester):
+        accounts = eth_tester.get_accounts()
+        transaction = {"from": accounts[0], "to": accounts[1], "gas": 21000}
+        old_hash = eth_tester.send_transaction(assoc(transaction, "value", 1))
+        old_block = eth_tester.get_block_by_number("latest", True)
+        assert old_block["transactions"][0]["value"] == 1
+
+        eth_tester.reset_to_genesis()
+        new_hash = eth_tester.send_transaction(assoc(transaction, "value", 2))
+        new_block = eth_tester.get_block_by_number("latest", True)
+
+        assert new_block["number"] == old_block["number"]
+        assert new_block["hash"] != old_block["hash"]
+        new_transaction = eth_tester.get_transaction_by_hash(new_hash)
+        assert new_transaction["value"] == 2
+        assert new_transaction["block_hash"] == new_block["hash"]
+        assert new_block["transactions"] == (new_transaction,)
+        with pytest.raises(TransactionNotFound):
+            eth_tester.get_transaction_by_hash(old_hash)
+
     def test_pending_block_not_found_when_fetched_by_number(self, eth_tester):
         # assert `latest` block can be fetched by number
         latest_block_num = eth_tester.get_block_by_number("latest")["number"]
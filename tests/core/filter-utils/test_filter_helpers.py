@@ -403,6 +403,21 @@ def test_check_if_topics_match(log_topics, filter_topics, expected):
     assert actual is expected
 
 
+@pytest.mark.parametrize(
+    "filter_topics",
+    (
+        (TOPIC_A, [TOPIC_A]),
+        (TOPIC_A, {1}),
+        (TOPIC_A, (TOPIC_B, [TOPIC_C])),
+        (TOPIC_A, 1),
+        [TOPIC_A],
+    ),
+)
+def test_check_if_topics_match_invalid_format(filter_topics):
+    with pytest.raises(ValueError, match="Unrecognized topics format"):
+        check_if_topics_match((TOPIC_A,), filter_topics)
+
+
 ADDRESS_A = b"\x00" * 20
 ADDRESS_B = b"\x00" * 19 + b"\x01"
 ADDRESS_C = b"\x00" * 19 + b"\x02"
@@ -439,6 +454,23 @@ def test_check_if_address_match(address, addresses, expected):
     assert actual is expected
 
 
+@pytest.mark.parametrize(
+    "addresses",
+    (
+        (ADDRESS_B, [ADDRESS_B]),
+        (ADDRESS_B, 1),
+        (ADDRESS_B, b"\x01"),
+    ),
+)
+def test_check_if_address_match_invalid_format(addresses):
+    with pytest.raises(ValueError):
+        check_if_address_match(ADDRESS_A, addresses)
+
+
+def test_check_if_address_match_finds_match_before_invalid_address():
+    assert check_if_address_match(ADDRESS_A, (ADDRESS_A, [ADDRESS_B])) is True
+
+
 def _make_log(block_number=10, topics=None, address=ADDRESS_A, _type="mined", **kwargs):
     return dict(
         block_number=block_number,
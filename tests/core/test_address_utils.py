@@ -0,0 +1,39 @@
+from eth_utils import (
+    decode_hex,
+    keccak,
+)
+import pytest
+import rlp
+
+from eth_tester.utils.address import (
+    generate_contract_address,
+)
+
+SENDER = decode_hex("0x6ac7ea33f8831ea9dcc53393aaa88b25a785dbf0")
+
+
+@pytest.mark.parametrize(
+    "address,nonce,expected",
+    (
+        (SENDER, 0, decode_hex("0xcd234a471b72ba2f1ccf0a70fcaba648a5eecd8d")),
+        (SENDER, 1, decode_hex("0x343c43a37d37dff08ae8c4a11544c718abb4fcf8")),
+        (SENDER, 2, decode_hex("0xf778b86fa74e846c4f0a1fbd1335fe81c00a0c91")),
+    ),
+)
+def test_generate_contract_address(address, nonce, expected):
+    assert generate_contract_address(address, nonce) == expected
+
+
+@pytest.mark.parametrize(
+    "address,nonce",
+    (
+        (SENDER, 0),
+        (SENDER, 2**64 - 1),
+        (b"", 0),
+        (b"\x01" * 19, 7),
+        (b"\x01" * 32, 7),
+    ),
+)
+def test_generate_contract_address_matches_inferred_rlp(address, nonce):
+    expected = keccak(rlp.encode([address, nonce]))[-20:]
+    assert generate_contract_address(address, nonce) == expected
@@ -8,6 +8,9 @@ from eth_tester import (
     EthereumTester,
     MockBackend,
 )
+from eth_tester.exceptions import (
+    BlockNotFound,
+)
 from eth_tester.utils.backend_testing import (
     BaseTestBackendDirect,
 )
@@ -25,3 +28,24 @@ class TestMockBackendDirect(BaseTestBackendDirect):
     @pytest.mark.skip(reason="receipt status not supported in MockBackend")
     def test_get_transaction_receipt_byzantium(self, eth_tester, test_transaction):
         pass
+
+    def test_revert_to_same_snapshot_more_than_once(self, eth_tester):
+        eth_tester.mine_blocks(2)
+        snapshot_id = eth_tester.take_snapshot()
+        latest_number = eth_tester.get_block_by_number("latest")["number"]
+
+        for num_blocks in (2, 3):
+            eth_tester.mine_blocks(num_blocks)
+            eth_tester.revert_to_snapshot(snapshot_id)
+            assert eth_tester.get_block_by_number("latest")["number"] == latest_number
+
+    def test_reverted_blocks_not_found_by_hash(self, eth_tester):
+        snapshot_id = eth_tester.take_snapshot()
+        kept_hash = eth_tester.get_block_by_number("latest")["hash"]
+        reverted_hash = eth_tester.mine_blocks(1)[0]
+        assert eth_tester.get_block_by_hash(reverted_hash)["hash"] == reverted_hash
+
+        eth_tester.revert_to_snapshot(snapshot_id)
+        assert eth_tester.get_block_by_hash(kept_hash)["hash"] == kept_hash
+        with pytest.raises(BlockNotFound):
+            eth_tester.get_block_by_hash(reverted_hash)